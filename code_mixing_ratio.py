@@ -21,6 +21,13 @@ Enter "help" below or click "Help" above for more information.
 ... These heuristics are lightweight and transparent. They do not claim perfect
 ... language identification and should be interpreted accordingly.
 ... 
+... Dependencies
+... ------------
+... - pandas
+... - re
+... - helpers.py (this repository; must sit next to this file)
+... - pyarrow (optional; faster string handling if installed)
+... 
 ... Usage examples
 ... --------------
 ... # Example 1: quick test on a single string
@@ -39,12 +46,28 @@ Enter "help" below or click "Help" above for more information.
 
 from __future__ import annotations
 import re
-from typing import Iterable, Optional, Set
+from functools import partial
+from typing import FrozenSet, Iterable, Optional, Set
 
 import pandas as pd
 
+from helpers import parallel_apply, to_arrow_strings
+
+
+# Letter class shared by the tokenizer patterns (Latin-1 letters + Turkish).
+LETTER_CLASS = "A-Za-zÀ-ÖØ-öø-ÿĞÜŞİğüşiçÇ"
+
+# A token is a maximal run of letters.
+TOKEN_RE = re.compile(rf"[{LETTER_CLASS}]+")
+
+# Tokens of a pure-ASCII text (smaller class, same result as TOKEN_RE there).
+ASCII_LETTERS_RE = re.compile(r"[A-Za-z]+")
 
-ASCII_WORD_RE = re.compile(r"^[A-Za-z]+$")
+# Tokenize and classify in one pass: the 'ascii' group matches whole
+# ASCII-only tokens, 'other' matches tokens containing any other letter.
+TOKEN_CLASS_RE = re.compile(
+    rf"(?P<ascii>[A-Za-z]+(?![{LETTER_CLASS}]))|(?P<other>[{LETTER_CLASS}]+)"
+)
 
 
 def is_english_token(
@@ -61,7 +84,7 @@ def is_english_token(
     if not token:
         return False
 
-    if not ASCII_WORD_RE.match(token):
+    if not (token.isascii() and token.isalpha()):
         return False
 
     if english_lexicon is not None:
@@ -75,8 +98,12 @@ def tokenize(text: str) -> Iterable[str]:
     Very simple whitespace and punctuation-based tokenizer.
     Keeps only alphanumeric word chunks.
     """
-    # Split on non-letter characters, drop empties
-    return [t for t in re.split(r"[^A-Za-zÀ-ÖØ-öø-ÿĞÜŞİğüşiçÇ]+", text) if t]
+    if not text:
+        return []
+    # Maximal letter runs (never empty)
+    if text.isascii():
+        return ASCII_LETTERS_RE.findall(text)
+    return TOKEN_RE.findall(text)
 
 
 def code_mixing_ratio(
@@ -89,20 +116,72 @@ def code_mixing_ratio(
 
     If there are zero tokens, returns 0.0.
     """
-    tokens = tokenize(text)
-    if not tokens:
+    if not text:
         return 0.0
 
-    eng_count = sum(
-        1 for tok in tokens if is_english_token(tok, english_lexicon=english_lexicon)
+    # The lexicon is used as given (a set); copying it here would make
+    # every call O(len(lexicon)). `cmr_on_series` freezes it once instead.
+    lex = english_lexicon
+
+    # Pure-ASCII text: every token is an ASCII token, no classification
+    if text.isascii():
+        tokens = ASCII_LETTERS_RE.findall(text)
+        if not tokens:
+            return 0.0
+        if lex is None:
+            return 1.0
+        eng_count = sum(1 for tok in tokens if tok.lower() in lex)
+        return eng_count / float(len(tokens))
+
+    total = eng_count = 0
+    for m in TOKEN_CLASS_RE.finditer(text):
+        total += 1
+        if m.lastgroup == "ascii" and (lex is None or m.group().lower() in lex):
+            eng_count += 1
+
+    if not total:
+        return 0.0
+    return eng_count / float(total)
+
+
+def _cmr_frame(
+    texts: pd.Series,
+    lex: Optional[FrozenSet[str]] = None,
+    text_col_name: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Vectorized CMR table for a chunk of non-null texts, indexed like `texts`.
+    Kept at module level so it can be pickled for `parallel_apply`.
+    The Arrow string cast is internal; the output keeps `texts` as given.
+    """
+    toks = to_arrow_strings(texts).str.findall(TOKEN_RE)
+    token_count = toks.str.len()
+
+    if lex is None:
+        # Tokens are letter runs, so an ASCII token is an ASCII-letter token;
+        # count them from the lists above instead of a second regex pass
+        eng_count = toks.map(lambda tl: sum(map(str.isascii, tl)))
+    else:
+        eng_count = toks.map(
+            lambda tl: sum(1 for t in tl if t.isascii() and t.lower() in lex)
+        )
+
+    cmr = (eng_count / token_count).where(token_count > 0, 0.0)
+    return pd.DataFrame(
+        {
+            (text_col_name or "text"): texts,
+            "token_count": token_count.astype(int),
+            "english_token_count": eng_count.astype(int),
+            "cmr": cmr.astype(float),
+        }
     )
-    return eng_count / float(len(tokens))
 
 
 def cmr_on_series(
     texts: pd.Series,
     english_lexicon: Optional[Set[str]] = None,
     text_col_name: Optional[str] = None,
+    min_rows: int = 10_000,
 ) -> pd.DataFrame:
     """
     Applies CMR to a pandas Series of strings and returns a DataFrame with:
@@ -119,24 +198,18 @@ def cmr_on_series(
         Optional set of valid English words to constrain English detection.
     text_col_name : Optional[str]
         Optional column name to use for the text in the output (default: 'text').
+    min_rows : int
+        Series with at least this many rows are split across CPU cores via a
+        `multiprocessing.Pool`. On Windows/macOS (spawn start method) the
+        calling script then needs an `if __name__ == "__main__":` guard;
+        pass a larger value (e.g. `len(texts) + 1`) to stay single-process.
     """
-    rows = []
-    for t in texts.fillna(""):
-        toks = tokenize(t)
-        token_count = len(toks)
-        eng_count = sum(
-            1 for tok in toks if is_english_token(tok, english_lexicon=english_lexicon)
-        )
-        cmr = (eng_count / token_count) if token_count > 0 else 0.0
-        rows.append(
-            {
-                (text_col_name or "text"): t,
-                "token_count": token_count,
-                "english_token_count": eng_count,
-                "cmr": cmr,
-            }
-        )
-    return pd.DataFrame(rows)
+    # Vectorized over the whole Series: a few pandas string passes
+    # instead of one Python-level tokenize call per row.
+    texts = texts.fillna("").reset_index(drop=True)
+    lex = frozenset(english_lexicon) if english_lexicon is not None else None
+    func = partial(_cmr_frame, lex=lex, text_col_name=text_col_name)
+    return parallel_apply(texts, func, min_rows=min_rows)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ Dependencies
 ------------
 - pandas
 - re
+- helpers.py (this repository; must sit next to this file)
 - nltk (optional; used only for stemming if installed)
 
 Usage Examples
@@ -31,13 +32,23 @@ python english_root_extraction.py
 from english_root_extraction import extract_english_roots
 roots = extract_english_roots("Bugün like'ladım ve save'ledim.")
 print(roots)
+
+# Example 3: Corpus-level root frequencies
+from english_root_extraction import extract_roots_from_series
+df, root_freq = extract_roots_from_series(texts)
+print(root_freq.most_common(20))
 """
 
 from __future__ import annotations
 import re
-from typing import List, Optional
+from collections import Counter
+from functools import lru_cache, partial
+from itertools import chain
+from typing import List, Optional, Tuple
 import pandas as pd
 
+from helpers import parallel_apply
+
 try:
     from nltk.stem import PorterStemmer
 except ImportError:
@@ -46,6 +57,15 @@ except ImportError:
 
 ENGLISH_FRAGMENT_RE = re.compile(r"[A-Za-z']+")
 
+# One shared stemmer; social media vocabulary is highly repetitive,
+# so stems are memoized per (lowercased) token.
+_STEMMER = PorterStemmer() if PorterStemmer is not None else None
+
+
+@lru_cache(maxsize=200_000)
+def _stem_cached(tok: str) -> str:
+    return _STEMMER.stem(tok)
+
 
 def extract_english_roots(
     text: str,
@@ -76,36 +96,68 @@ def extract_english_roots(
     if not tokens:
         return []
 
-    if use_stemming and PorterStemmer is not None:
-        stemmer = PorterStemmer()
-        return [stemmer.stem(tok.lower()) for tok in tokens]
+    lower_toks = [tok.lower() for tok in tokens]
+    if use_stemming and _STEMMER is not None:
+        return list(map(_stem_cached, lower_toks))
     else:
-        return [tok.lower() for tok in tokens]
+        return lower_toks
 
 
-def extract_roots_from_series(
+def _roots_frame(
     texts: pd.Series,
     use_stemming: bool = True,
 ) -> pd.DataFrame:
+    """
+    Root extraction for a chunk of non-null texts, indexed like `texts`.
+    Kept at module level so it can be pickled for `parallel_apply`.
+    """
+    # One list per output column (no dict per row)
+    n = len(texts)
+    txts = texts.tolist()
+    roots_col = [None] * n
+    counts = [0] * n
+    for i, t in enumerate(txts):
+        roots = extract_english_roots(t, use_stemming=use_stemming)
+        roots_col[i] = roots
+        counts[i] = len(set(roots))
+    return pd.DataFrame(
+        {
+            "text": txts,
+            "english_roots": roots_col,
+            "root_count": counts,
+        },
+        index=texts.index,
+    )
+
+
+def extract_roots_from_series(
+    texts: pd.Series,
+    use_stemming: bool = True,
+    min_rows: int = 10_000,
+) -> Tuple[pd.DataFrame, Counter]:
     """
     Applies English root extraction across a pandas Series of texts.
+    Series with at least `min_rows` rows are split across CPU cores via a
+    `multiprocessing.Pool`. On Windows/macOS (spawn start method) the
+    calling script then needs an `if __name__ == "__main__":` guard;
+    pass a larger `min_rows` to stay single-process.
 
-    Returns a DataFrame with:
-    - 'text' (original text)
-    - 'english_roots' (list of English roots)
-    - 'root_count' (number of unique roots)
+    Returns
+    -------
+    Tuple[pd.DataFrame, Counter]
+        A DataFrame with:
+        - 'text' (original text)
+        - 'english_roots' (list of English roots)
+        - 'root_count' (number of unique roots)
+        and a corpus-level Counter of root frequencies.
     """
-    results = []
-    for t in texts.fillna(""):
-        roots = extract_english_roots(t, use_stemming=use_stemming)
-        results.append(
-            {
-                "text": t,
-                "english_roots": roots,
-                "root_count": len(set(roots)),
-            }
-        )
-    return pd.DataFrame(results)
+    texts = texts.fillna("").reset_index(drop=True)
+    func = partial(_roots_frame, use_stemming=use_stemming)
+    df = parallel_apply(texts, func, min_rows=min_rows)
+
+    # One flat pass over all roots
+    root_freq = Counter(chain.from_iterable(df["english_roots"]))
+    return df, root_freq
 
 
 if __name__ == "__main__":
@@ -49,9 +49,17 @@ except ImportError:
     plt = None
 
 
+TOKEN_RE = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿĞÜŞİğüşiçÇ]+")
+ASCII_LETTERS_RE = re.compile(r"[A-Za-z]+")
+
+
 def tokenize(text: str) -> list[str]:
     """Simple alphanumeric tokenizer for Turkish-English mixed texts."""
-    return [t for t in re.split(r"[^A-Za-zÀ-ÖØ-öø-ÿĞÜŞİğüşiçÇ]+", text) if t]
+    if not text:
+        return []
+    if text.isascii():
+        return ASCII_LETTERS_RE.findall(text)
+    return TOKEN_RE.findall(text)
 
 
 def eda_summary(
@@ -93,8 +101,10 @@ def eda_summary(
     df = df.dropna(subset=[text_column])
     df[text_column] = df[text_column].astype(str)
 
-    df["token_count"] = df[text_column].apply(lambda x: len(tokenize(x)))
-    df["char_count"] = df[text_column].apply(len)
+    # Vectorized counts (same tokens as `tokenize`)
+    toks = df[text_column].str.findall(TOKEN_RE)
+    df["token_count"] = toks.str.len().astype("int32")
+    df["char_count"] = df[text_column].str.len().astype("int32")
 
     # Basic descriptive statistics
     summary = df[["token_count", "char_count"]].describe()
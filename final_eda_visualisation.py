@@ -2,12 +2,15 @@
 # FINAL EDA + VISUALIZATION (Thesis Version)
 # ============================
 
-!pip install -q pandas numpy matplotlib seaborn openpyxl xlsxwriter
+!pip install -q pandas numpy scipy matplotlib seaborn openpyxl xlsxwriter pyarrow
 
 import os
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # figures are only saved to files; before seaborn/pyplot
 import seaborn as sns
+from scipy.stats import rankdata
 import matplotlib.pyplot as plt
 
 # ---- File Paths ----
@@ -15,13 +18,27 @@ P_TRANSCRIPT_XLSX = "/content/31_satir_veriseti__with_detect.xlsx"
 P_ENGAGEMENT_XLSX = "/content/youtube_engagement_rates.xlsx"
 
 # ---- Safe Read Function ----
+# Excel files are cached as "<file>.xlsx.parquet" on first read;
+# reruns load the cache while it is newer than the Excel file.
 def safe_read(path):
     if not os.path.exists(path):
         print(f"❌ File not found: {path}")
         return pd.DataFrame()
+    pq = path + ".parquet"
+    if (path.lower().endswith(".xlsx") and os.path.exists(pq)
+            and os.path.getmtime(pq) >= os.path.getmtime(path)):
+        try:
+            return pd.read_parquet(pq)
+        except Exception as e:
+            print(f"⚠️ Error reading cache {pq}: {e}")
     try:
         if path.lower().endswith(".xlsx"):
-            return pd.read_excel(path)
+            df = pd.read_excel(path)
+            try:
+                df.to_parquet(pq, index=False)
+            except Exception as e:
+                print(f"⚠️ Could not write cache {pq}: {e}")
+            return df
         elif path.lower().endswith(".csv"):
             return pd.read_csv(path)
     except Exception as e:
@@ -54,18 +71,25 @@ rename_map = {
 eng = eng.rename(columns=rename_map)
 
 # ---- Convert numeric formats (comma → dot, strings → numbers) ----
-for c in eng.columns:
-    if eng[c].dtype == object:
-        eng[c] = eng[c].astype(str).str.replace(",", ".").str.replace(" ", "")
-        eng[c] = pd.to_numeric(eng[c], errors="ignore")
+# One translate pass per text column; numeric columns are skipped.
+num_trans = str.maketrans({",": ".", " ": ""})
+for c in eng.select_dtypes(include=["object", "string"]).columns:
+    cleaned = eng[c].astype(str).str.translate(num_trans)
+    try:
+        eng[c] = pd.to_numeric(cleaned)
+    except (ValueError, TypeError):
+        eng[c] = cleaned
+
+# Column set is fixed from here on; snapshot it for membership tests
+cols = frozenset(eng.columns)
 
 numeric_cols_to_convert = ["views", "likes", "comments", "subscribers", "ER_View_%", "ER_Subscriber_%"]
 for c in numeric_cols_to_convert:
-    if c in eng.columns:
+    if c in cols:
         eng[c] = pd.to_numeric(eng[c], errors="coerce")
 
 # ---- Numeric Columns ----
-num_cols = [c for c in ["views","likes","comments","subscribers","ER_View_%","ER_Subscriber_%"] if c in eng.columns]
+num_cols = [c for c in ["views","likes","comments","subscribers","ER_View_%","ER_Subscriber_%"] if c in cols]
 print("\nNumeric columns:", num_cols)
 
 # ---- Descriptive Statistics ----
@@ -78,10 +102,10 @@ else:
 # ---- QC Report ----
 qc = {
     "Video Count": len(eng),
-    "Average ER_View_%": round(eng["ER_View_%"].mean(), 2) if "ER_View_%" in eng.columns else "-",
-    "Average ER_Subscriber_%": round(eng["ER_Subscriber_%"].mean(), 2) if "ER_Subscriber_%" in eng.columns else "-",
-    "Max ER_View_%": round(eng["ER_View_%"].max(), 2) if "ER_View_%" in eng.columns else "-",
-    "Max ER_Subscriber_%": round(eng["ER_Subscriber_%"].max(), 2) if "ER_Subscriber_%" in eng.columns else "-",
+    "Average ER_View_%": round(eng["ER_View_%"].mean(), 2) if "ER_View_%" in cols else "-",
+    "Average ER_Subscriber_%": round(eng["ER_Subscriber_%"].mean(), 2) if "ER_Subscriber_%" in cols else "-",
+    "Max ER_View_%": round(eng["ER_View_%"].max(), 2) if "ER_View_%" in cols else "-",
+    "Max ER_Subscriber_%": round(eng["ER_Subscriber_%"].max(), 2) if "ER_Subscriber_%" in cols else "-",
 }
 print("\n📊 QC REPORT:")
 for k, v in qc.items():
@@ -94,48 +118,61 @@ for k, v in qc.items():
 os.makedirs("/content/eda_images", exist_ok=True)
 sns.set(style="whitegrid")
 
+# ---- One reusable figure, cleared between charts ----
+fig = plt.figure(figsize=(6,4))
+
+def reset_axes(figsize=(6,4)):
+    fig.clf()
+    fig.set_size_inches(*figsize)
+    return fig.add_subplot()
+
 # 1. Histogram – ER_View_%
-if "ER_View_%" in eng.columns:
-    plt.figure(figsize=(6,4))
-    sns.histplot(eng["ER_View_%"].dropna(), bins=15, kde=True, color="skyblue")
-    plt.xlabel("Engagement Rate (per View) [%]", fontsize=11)
-    plt.ylabel("Frequency", fontsize=11)
-    plt.tight_layout()
-    plt.savefig("/content/eda_images/hist_ER_View.png", dpi=300)
-    plt.close()
+if "ER_View_%" in cols:
+    ax = reset_axes()
+    sns.histplot(eng["ER_View_%"].dropna(), bins=15, kde=True, color="skyblue", ax=ax)
+    ax.set_xlabel("Engagement Rate (per View) [%]", fontsize=11)
+    ax.set_ylabel("Frequency", fontsize=11)
+    fig.tight_layout()
+    fig.savefig("/content/eda_images/hist_ER_View.png", dpi=300)
 
 # 2. Histogram – ER_Subscriber_%
-if "ER_Subscriber_%" in eng.columns:
-    plt.figure(figsize=(6,4))
-    sns.histplot(eng["ER_Subscriber_%"].dropna(), bins=15, kde=True, color="lightcoral")
-    plt.xlabel("Engagement Rate (per Subscriber) [%]", fontsize=11)
-    plt.ylabel("Frequency", fontsize=11)
-    plt.tight_layout()
-    plt.savefig("/content/eda_images/hist_ER_Subscriber.png", dpi=300)
-    plt.close()
+if "ER_Subscriber_%" in cols:
+    ax = reset_axes()
+    sns.histplot(eng["ER_Subscriber_%"].dropna(), bins=15, kde=True, color="lightcoral", ax=ax)
+    ax.set_xlabel("Engagement Rate (per Subscriber) [%]", fontsize=11)
+    ax.set_ylabel("Frequency", fontsize=11)
+    fig.tight_layout()
+    fig.savefig("/content/eda_images/hist_ER_Subscriber.png", dpi=300)
 
 # 3. Scatter – Subscribers vs ER_View
-if all(c in eng.columns for c in ["subscribers", "ER_View_%"]):
-    plt.figure(figsize=(6,4))
-    sns.scatterplot(data=eng, x="subscribers", y="ER_View_%", alpha=0.8)
-    plt.xlabel("Subscribers", fontsize=11)
-    plt.ylabel("Engagement Rate (per View) [%]", fontsize=11)
-    plt.tight_layout()
-    plt.savefig("/content/eda_images/scatter_subs_vs_erview.png", dpi=300)
-    plt.close()
+if {"subscribers", "ER_View_%"}.issubset(cols):
+    ax = reset_axes()
+    sns.scatterplot(data=eng, x="subscribers", y="ER_View_%", alpha=0.8, ax=ax)
+    ax.set_xlabel("Subscribers", fontsize=11)
+    ax.set_ylabel("Engagement Rate (per View) [%]", fontsize=11)
+    fig.tight_layout()
+    fig.savefig("/content/eda_images/scatter_subs_vs_erview.png", dpi=300)
 
 # 4. Heatmap – Spearman correlations
-corr_cols = [c for c in ["views","likes","comments","subscribers","ER_View_%","ER_Subscriber_%"] if c in eng.columns]
+corr_cols = [c for c in ["views","likes","comments","subscribers","ER_View_%","ER_Subscriber_%"] if c in cols]
 if len(corr_cols) >= 3:
-    plt.figure(figsize=(6,5))
-    corr = eng[corr_cols].corr(method="spearman")
+    ax = reset_axes(figsize=(6,5))
+    # Spearman = Pearson on ranks: rank each column once, one corrcoef call.
+    # Missing values need pairwise deletion, so fall back to pandas then.
+    if eng[corr_cols].notna().all().all():
+        ranks = np.column_stack([rankdata(eng[c].to_numpy()) for c in corr_cols])
+        corr = pd.DataFrame(np.corrcoef(ranks, rowvar=False),
+                            index=corr_cols, columns=corr_cols)
+    else:
+        corr = eng[corr_cols].corr(method="spearman")
     sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f",
-                cbar_kws={"label": "Spearman Correlation"})
-    plt.xlabel("Variables", fontsize=11)
-    plt.ylabel("Variables", fontsize=11)
-    plt.tight_layout()
-    plt.savefig("/content/eda_images/heatmap_spearman.png", dpi=300)
-    plt.close()
+                cbar_kws={"label": "Spearman Correlation"}, ax=ax)
+    ax.set_xlabel("Variables", fontsize=11)
+    ax.set_ylabel("Variables", fontsize=11)
+    fig.tight_layout()
+    fig.savefig("/content/eda_images/heatmap_spearman.png", dpi=300)
+
+plt.close(fig)
 
 # ============================
 # DONE
@@ -0,0 +1,109 @@
+# Author: Cagri Demirci
+# Shared Helpers for the Thesis Scripts
+# Part of MSc Thesis (2025)
+
+"""
+Shared Helpers
+
+Small utilities shared by the analysis scripts in this repository.
+
+parallel_apply
+--------------
+Splits a pandas Series into contiguous row chunks and runs a chunk-level
+function on each chunk in a process pool. Inputs shorter than `min_rows`
+are processed serially, because process start-up and pickling the text
+payload would cost more than the work itself.
+
+On platforms that start workers with "spawn" (Windows, macOS), each worker
+re-imports the calling script, so code that reaches `parallel_apply` must
+sit behind an `if __name__ == "__main__":` guard.
+
+to_arrow_strings
+----------------
+Converts a text Series to the pyarrow-backed string dtype (contiguous
+UTF-8 buffers) so vectorized `.str` methods avoid per-cell Python
+objects. Falls back to the input unchanged if pyarrow is not installed.
+
+Dependencies
+------------
+- pandas
+- numpy
+- pyarrow (optional; used by `to_arrow_strings` if installed)
+
+Usage Examples
+---------------
+from functools import partial
+from helpers import parallel_apply
+result = parallel_apply(texts, partial(my_chunk_function, option=True))
+"""
+
+from __future__ import annotations
+import multiprocessing as mp
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def parallel_apply(
+    series: pd.Series,
+    func: Callable[[pd.Series], Union[pd.Series, pd.DataFrame]],
+    min_rows: int = 10_000,
+    processes: Optional[int] = None,
+) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Applies a chunk-level function to a Series, in parallel for large inputs.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Input data; chunks keep their original index labels.
+    func : Callable
+        Top-level (picklable) function taking a Series chunk and returning a
+        Series or DataFrame indexed like that chunk. Use `functools.partial`
+        to bind extra arguments.
+    min_rows : int
+        Inputs shorter than this are processed serially with `func(series)`.
+        On spawn-start platforms (Windows, macOS) the parallel path requires
+        the calling script to use an `if __name__ == "__main__":` guard.
+    processes : Optional[int]
+        Number of worker processes (default: `multiprocessing.cpu_count()`).
+
+    Returns
+    -------
+    pd.Series or pd.DataFrame
+        The chunk results concatenated in the original row order.
+    """
+    cores = processes or mp.cpu_count()
+    if len(series) < min_rows or cores < 2:
+        return func(series)
+
+    # Chunk by row count so every worker gets a similar share of rows
+    bounds = np.array_split(np.arange(len(series)), cores)
+    chunks = [series.iloc[b[0] : b[-1] + 1] for b in bounds if len(b)]
+    if len(chunks) < 2:
+        return func(series)
+
+    with mp.Pool(min(cores, len(chunks))) as pool:
+        parts = pool.map(func, chunks)
+    return pd.concat(parts)
+
+
+def to_arrow_strings(series: pd.Series) -> pd.Series:
+    """
+    Returns `series` as pyarrow-backed strings ("string[pyarrow]").
+
+    If pyarrow is not installed, or the values cannot be encoded as UTF-8
+    (e.g. lone surrogates from scraped JSON), the Series is returned unchanged.
+    """
+    if pa is None:
+        return series
+    try:
+        return series.astype("string[pyarrow]")
+    except (UnicodeEncodeError, pa.ArrowException):
+        return series
@@ -22,6 +22,7 @@ to avoid division errors.
 Dependencies
 ------------
 - pandas
+- numpy
 
 Usage Examples
 ---------------
@@ -35,6 +36,7 @@ print(rate)
 """
 
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
 
@@ -65,22 +67,46 @@ def calculate_engagement_rate(
     return ((likes + comments) / views) * 100.0
 
 
-def engagement_rate_on_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def engagement_rate_on_dataframe(
+    df: pd.DataFrame,
+    inplace: bool = False,
+) -> pd.DataFrame:
     """
     Applies the engagement rate calculation across a DataFrame containing
     columns 'likes', 'comments', and 'views'.
 
-    Returns a new DataFrame with an additional 'engagement_rate' column.
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input data with 'likes', 'comments', and 'views' columns.
+    inplace : bool
+        If True, adds the 'engagement_rate' column to `df` itself and returns
+        it (no copy; the caller's DataFrame is modified). If False (default),
+        returns a new DataFrame via `DataFrame.assign`, leaving `df` unchanged.
+        On pandas 3 (Copy-on-Write) that new DataFrame shares the existing
+        columns; on pandas < 3 without Copy-on-Write, `assign` still makes a
+        full deep copy, so use `inplace=True` to avoid copying large frames.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with an additional 'engagement_rate' column.
     """
     if not {"likes", "comments", "views"}.issubset(df.columns):
         raise ValueError("DataFrame must contain 'likes', 'comments', and 'views' columns")
 
-    df = df.copy()
-    df["engagement_rate"] = df.apply(
-        lambda row: calculate_engagement_rate(row["likes"], row["comments"], row["views"]),
-        axis=1,
-    )
-    return df
+    # Same formula as `calculate_engagement_rate`, computed column-wise.
+    likes = df["likes"].to_numpy(dtype="float64", na_value=np.nan)
+    comments = df["comments"].to_numpy(dtype="float64", na_value=np.nan)
+    views = df["views"].to_numpy(dtype="float64", na_value=np.nan)
+    has_views = views > 0
+    safe_views = np.where(has_views, views, 1.0)
+    rate = np.where(has_views, (likes + comments) / safe_views * 100.0, 0.0)
+
+    if inplace:
+        df["engagement_rate"] = rate
+        return df
+    return df.assign(engagement_rate=rate)
 
 
 if __name__ == "__main__":